@@ -1,400 +1,246 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import unittest
 import re
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
 from operator import itemgetter
+from sys import intern
 
 from ansible.errors import AnsibleFilterError, AnsibleFilterTypeError
 from ansible.module_utils.common.collections import is_sequence
-from ansible.utils.display import Display
 
-display = Display()
+# Version strings are ASCII, so match with re.ASCII; \d is then only [0-9] rather than every Unicode decimal digit
+version_name_matcher = re.compile(r'(?P<major>\d+)\.(?P<minor>\d+)\.(?P<point>\d+)(?:-(?P<decorator>.+))?$', re.ASCII)
+first_digit_matcher = re.compile(r'\d', re.ASCII)
+version_key_matcher = re.compile(r'^(?P<major>\d+)(?:\.(?P<minor>\d+)(?:\.(?P<point>\d+)(?:-(?P<decorator>.+))?)?)?$', re.ASCII)
 
-version_name_matcher = re.compile(r'(?P<major>\d+)\.(?P<minor>\d+)\.(?P<point>\d+)(\-(?P<decorator>.+))?$')
-version_key_matcher = re.compile(r'^(?P<major>\d+)(\.(?P<minor>\d+)(\.(?P<point>\d+)(\-(?P<decorator>.+))?)?)?$')
+# Each of major, minor and point must be less than this to be packed by pack_version_key()
+version_part_limit = 1 << 64
+
+# The parallel columns returned by sort_versions_ascending()
+SortedVersions = namedtuple('SortedVersions', ['version_keys', 'decorators', 'input_indices', 'stripped_version_labels'])
 
 
 def github_release_version(input_to_process, criteria, *args, include_decorated_versions=False, normalize=True):
     '''Return a version from an input list of github releases based on the match criteria.'''
-    if not is_sequence(input_to_process):
+    # lists and tuples are checked directly because is_sequence() goes through the Sequence ABC machinery
+    if not isinstance(input_to_process, (list, tuple)) and not is_sequence(input_to_process):
         raise AnsibleFilterTypeError(f"github_release_version requires a sequence input, but got {type(input_to_process)}")
 
     if len(input_to_process) == 0:
         return []
 
-    sorted_input_versions = sort_versions_ascending(input_to_process)
+    try:
+        (takes_key, matcher) = criteria_matchers[criteria]
+    except (KeyError, TypeError):
+        raise AnsibleFilterError(f"criteria {criteria} not understood by github_release_version")
 
-    if not include_decorated_versions:
-        sorted_input_versions = filter_out_decorated_versions_from(sorted_input_versions)
+    key_info = None
+    if takes_key:
+        if len(args) != 1:
+            raise AnsibleFilterError(f"'{criteria}' requires a version")
+        key_info = parse_match_key(args[0], criteria)
 
-    matching_versions = []
+    versions = tuple(input_to_process)
+    sorted_versions = sort_versions_ascending(versions, not include_decorated_versions)
 
-    if criteria == "latest":
-        matching_versions = match_latest(sorted_input_versions)
-    elif criteria == "gte":
-        if len(args) != 1:
-            raise AnsibleFilterError("'gte' requires a version")
-        matching_versions = match_gte(sorted_input_versions, args[0])
-    elif criteria == "lte":
-        if len(args) != 1:
-            raise AnsibleFilterError("'lte' requires a version")
-        matching_versions = match_lte(sorted_input_versions, args[0])
-    elif criteria == "eq":
-        if len(args) != 1:
-            raise AnsibleFilterError("'eq' requires a version")
-        matching_versions = match_eq(sorted_input_versions, args[0])
-    else:
-        raise AnsibleFilterError(f"criteria {criteria} not understood by github_release_version")
+    (lower, upper) = matcher(sorted_versions.version_keys, key_info)
 
     if normalize:
-        return [x['stripped_version_label'] for x in matching_versions]
+        labels = sorted_versions.stripped_version_labels[lower:upper]
     else:
-        return [x['full_label'] for x in matching_versions]
+        # The cache hands back the entry for any equal input, so full labels are taken from this call's own input
+        # (which may be, e.g., unsafe text) rather than stored in the entry
+        labels = [versions[index] for index in sorted_versions.input_indices[lower:upper]]
+
+    # Only an 'eq' key can have a decorator.  The matcher selects by major.minor.point, so narrow that by decorator.
+    if key_info is not None and key_info[3] is not None:
+        decorators = sorted_versions.decorators[lower:upper]
+        return [label for (label, decorator) in zip(labels, decorators) if decorator == key_info[3]]
+
+    return list(labels)
+
+
+@lru_cache(maxsize=128)
+def sort_versions_ascending(versions, drop_decorated=False):
+    '''Given a tuple of versions, return a SortedVersions of four tuples, version_keys, decorators, input_indices and
+       stripped_version_labels, each holding one entry per version in major.minor.point ascending order.  A version
+       key is the major, minor and point integers packed by pack_version_key().  The decorator does not include the
+       leading dash and is the empty string if there is no decorator present.  The input index is the position of the
+       version in versions and the stripped version label is the version starting from vX.Y.Z or X.Y.Z (if there is
+       no leading 'v'), as a plain str.  If drop_decorated is True, versions that have a decorator are left out.
+
+       Each task runs in its own worker process, so the cache only helps when the filter is applied more than once to
+       the same list within a single task (e.g., in a loop or in several expressions of one template).  versions must
+       be a tuple so that it can be a cache key.  Because an entry is shared by every equal input, it holds nothing
+       taken from the input other than plain strings.'''
+    version_info = []
 
+    for (index, version) in enumerate(versions):
+        (stripped_version_label, major, minor, point, decorator) = parse_version_name(version)
+        if drop_decorated and decorator:
+            continue
 
-def sort_versions_ascending(versions):
-    '''Given a list of versions, return a list of dicts.  Each dict is keyed by 'stripped_version_label', 'full_label',
-       'major', 'minor', 'point' and 'decorator'. for that version.  'major', 'minor' and 'point' are all integers.
-       The ordering is major.minor.point ascending.  The decorator does not include the leading dash and is the empty
-       string if there is no decorator present.  'stripped_version_label' is the version starting from vX.Y.Z or X.Y.Z
-       (if there is no leading 'v').  'full_label' is the version name exactly as it is labeled.'''
-    version_info = []
+        if major >= version_part_limit or minor >= version_part_limit or point >= version_part_limit:
+            raise AnsibleFilterError(f"incoming version {version} has a version number that is too large")
 
-    for version in versions:
-        m = version_name_matcher.search(version)
-        if m is None:
-            raise AnsibleFilterError(f"incoming version {version} is not in accepted format")
+        # Releases tend to reuse a handful of decorators (alpha, beta, rc1), so intern them; the cached columns then
+        # share one string per decorator and 'eq' comparisons against a decorated key usually short-circuit on identity.
+        # Most versions have no decorator, and the empty string needs no interning.
+        if decorator:
+            decorator = intern(decorator)
+
+        # This is pack_version_key() inlined, since the parts are already known to be within version_part_limit
+        version_key = (major << 128) + (minor << 64) + point
 
-        version_info.append(
-            {
-                "stripped_version_label": m.group(),
-                "full_label": version,
-                "major": int(m.group('major')),
-                "minor": int(m.group('minor')),
-                "point": int(m.group('point')),
-                "decorator": '' if m.group('decorator') is None else m.group('decorator'),
-            })
+        version_info.append((version_key, decorator, index, str(stripped_version_label)))
 
-    return sorted(version_info, key=itemgetter("major", "minor", "point"))
+    # The sort is stable, so versions that share a major.minor.point keep their input order.  Transposing the sorted
+    # rows into columns with zip() is cheaper than appending to four lists and gathering each by a sorted index.
+    version_info.sort(key=itemgetter(0))
 
+    return SortedVersions._make(zip(*version_info)) if version_info else SortedVersions((), (), (), ())
 
-def filter_out_decorated_versions_from(versions_list):
-    '''Expect list of tuples as in sort_version_ascending().  Remove any tuple that includes a decorator.'''
-    return [i for i in versions_list if i["decorator"] == '']
 
+def pack_version_key(major, minor=0, point=0):
+    '''Pack major.minor.point into a single integer which orders the same way as the tuple (major, minor, point) when
+       minor and point are less than version_part_limit.  Integer comparisons are cheaper than tuple comparisons for
+       sorting and bisecting.  Since no stored version has a part that large, a larger minor or point in a match key is
+       packed as the next version up (x.y.limit as x.(y+1).0 and x.limit.z as (x+1).0.0), which is still a correct
+       search bound.'''
+    if minor >= version_part_limit:
+        return (major + 1) << 128
 
-def match_latest(sorted_input_versions):
-    '''Return the last item in sorted_input_versions, which should be the 'latest' version.'''
-    if len(sorted_input_versions) == 0:
-        return ''
+    return (major << 128) + (minor << 64) + min(point, version_part_limit)
 
-    return [sorted_input_versions[len(sorted_input_versions)-1]]
 
+def parse_version_name(version):
+    '''Return (stripped_version_label, major, minor, point, decorator) for a single version name.  The version is taken
+       to start at the first digit, which skips a leading 'v' or a release title (e.g., 'Helm v3.1.0'), and is split
+       by hand when it has the form X.Y.Z with an optional -decorator.  Anything else falls back to
+       version_name_matcher.'''
+    core = version[1:] if version.startswith('v') else version
 
-def match_eq(sorted_input_versions, key):
-    '''Execute the 'eq' matching logic against the sorted_input_version list.'''
-    key = version_key_matcher.fullmatch(key)
+    if not core[:1].isdigit():
+        first_digit = first_digit_matcher.search(version)
+        if first_digit is None:
+            raise AnsibleFilterError(f"incoming version {version} is not in accepted format")
+        core = version[first_digit.start():]
 
-    if key is None:
-        raise AnsibleFilterError(f"match key ({key}) is not valid for 'eq' operator")
+    (head, dash, decorator) = core.partition('-')
+    parts = head.split('.')
 
-    if key.group('decorator') is not None:
-        return [parsed_version for parsed_version in sorted_input_versions if parsed_version['full_label'] == key]
+    # version_name_matcher cannot match a decorator across a newline, so leave those to the regex
+    if len(parts) == 3 and head.isascii() and (decorator or not dash) and '\n' not in decorator:
+        (major, minor, point) = parts
+        if major.isdigit() and minor.isdigit() and point.isdigit():
+            return (core, int(major), int(minor), int(point), decorator)
 
-    wanted_major_version = int(key.group('major'))
+    m = version_name_matcher.search(version)
+    if m is None:
+        raise AnsibleFilterError(f"incoming version {version} is not in accepted format")
 
-    matches = [parsed_version for parsed_version in sorted_input_versions if parsed_version['major'] == wanted_major_version]
+    # Fetch every group in one call rather than looking each one up by name
+    (major, minor, point, decorator) = m.groups('')
 
-    if key.group('minor') is not None:
-        wanted_minor_version = int(key.group('minor'))
-        matches = [parsed_version for parsed_version in matches if parsed_version['minor'] == wanted_minor_version]
+    return (m.group(), int(major), int(minor), int(point), decorator)
 
-    if key.group('point') is not None:
-        wanted_point_version = int(key.group('point'))
-        matches = [parsed_version for parsed_version in matches if parsed_version['point'] == wanted_point_version]
 
-    return matches
+def match_latest(version_keys, key_info):
+    '''Return the (lower, upper) index bounds of the last version in version_keys, which should be the 'latest'
+       version.  key_info is not used, but is accepted so that every matcher in criteria_matchers is called the same
+       way.'''
+    return (max(len(version_keys) - 1, 0), len(version_keys))
 
 
-def match_gte(sorted_input_versions, key):
-    '''Execute 'gte' matching logic on the sorted_input_versions.'''
+def parse_match_key(key, criteria):
+    '''Parse a match key of the form x, x.y, x.y.z or x.y.z-decorator into a tuple (major, minor, point, decorator).
+       'major', 'minor' and 'point' are integers.  Any part that is not present in the key is None.  A decorator is
+       only accepted by the 'eq' criteria.'''
     key_matcher = version_key_matcher.fullmatch(key)
 
     if key_matcher is None:
-        raise AnsibleFilterError(f"match key ({key}) is not valid for 'eq' operator")
+        raise AnsibleFilterError(f"match key ({key}) is not valid for '{criteria}' operator")
 
-    if key_matcher.group('decorator') is not None:
-        raise AnsibleFilterError(f"match key ({key}) contains a decorator with is meaningless with 'gte' filter")
+    (major, minor, point, decorator) = key_matcher.group('major', 'minor', 'point', 'decorator')
 
-    wanted_major_version = int(key_matcher.group('major'))
+    if decorator is not None and criteria != "eq":
+        raise AnsibleFilterError(f"match key ({key}) contains a decorator which is meaningless with '{criteria}' filter")
 
-    # next_element_after_match is a pointer to an index of sorted_input_versions.  Since the list is sorted first by major, then minor, then point,
-    # advance this pointer according to match rules.  In this case, all values starting at this pointer are returned.
-    next_element_after_match = 0
-    while next_element_after_match < len(sorted_input_versions) and sorted_input_versions[next_element_after_match]['major'] < wanted_major_version:
-        next_element_after_match += 1
+    return (
+        int(major),
+        None if minor is None else int(minor),
+        None if point is None else int(point),
+        None if decorator is None else intern(decorator),
+    )
 
-    if key_matcher.group('minor') is not None:
-        wanted_minor_version = int(key_matcher.group('minor'))
-        while (next_element_after_match < len(sorted_input_versions) and
-               sorted_input_versions[next_element_after_match]['major'] == wanted_major_version and
-               sorted_input_versions[next_element_after_match]['minor'] < wanted_minor_version):
-            next_element_after_match += 1
 
-        if key_matcher.group('point') is not None:
-            wanted_point_version = int(key_matcher.group('point'))
-            while (next_element_after_match < len(sorted_input_versions) and
-                   sorted_input_versions[next_element_after_match]['major'] == wanted_major_version and
-                   sorted_input_versions[next_element_after_match]['minor'] == wanted_minor_version and
-                   sorted_input_versions[next_element_after_match]['point'] < wanted_point_version):
-                next_element_after_match += 1
+def match_key_bounds(key_info):
+    '''Return (lower_key, upper_key), the packed version keys that bound the versions equal to key_info, a tuple as
+       returned by parse_match_key().  lower_key is the key itself, with a missing minor or point as 0, and upper_key
+       is the key with its last given part incremented, so a version equals the key when lower_key <= key < upper_key.
+       The decorator is not considered.'''
+    (wanted_major_version, wanted_minor_version, wanted_point_version) = key_info[:3]
 
-    return sorted_input_versions[next_element_after_match:]
+    if wanted_minor_version is None:
+        return (pack_version_key(wanted_major_version), pack_version_key(wanted_major_version + 1))
 
+    if wanted_point_version is None:
+        return (
+            pack_version_key(wanted_major_version, wanted_minor_version),
+            pack_version_key(wanted_major_version, wanted_minor_version + 1),
+        )
 
-def match_lte(sorted_input_versions, key):
-    '''Execute 'lte' matching logic on the sorted_input_versions.'''
-    key_matcher = version_key_matcher.fullmatch(key)
+    return (
+        pack_version_key(wanted_major_version, wanted_minor_version, wanted_point_version),
+        pack_version_key(wanted_major_version, wanted_minor_version, wanted_point_version + 1),
+    )
 
-    if key_matcher is None:
-        raise AnsibleFilterError(f"match key ({key}) is not valid for 'eq' operator")
-
-    if key_matcher.group('decorator') is not None:
-        raise AnsibleFilterError(f"match key ({key}) contains a decorator with is meaningless with 'lte' filter")
-
-    wanted_major_version = int(key_matcher.group('major'))
-
-    # next_element_after_match is a pointer to an index of sorted_input_versions.  Since the list is sorted first by major, then minor, then point,
-    # advance this pointer according to match rules.
-    next_element_after_match = 0
-    while next_element_after_match < len(sorted_input_versions) and sorted_input_versions[next_element_after_match]['major'] < wanted_major_version:
-        next_element_after_match += 1
-
-    if key_matcher.group('minor') is not None:
-        wanted_minor_version = int(key_matcher.group('minor'))
-        while (next_element_after_match < len(sorted_input_versions) and
-               sorted_input_versions[next_element_after_match]['major'] == wanted_major_version and
-               sorted_input_versions[next_element_after_match]['minor'] < wanted_minor_version):
-            next_element_after_match += 1
-
-        if key_matcher.group('point') is not None:
-            wanted_point_version = int(key_matcher.group('point'))
-            while (next_element_after_match < len(sorted_input_versions) and
-                   sorted_input_versions[next_element_after_match]['major'] == wanted_major_version and
-                   sorted_input_versions[next_element_after_match]['minor'] == wanted_minor_version and
-                   sorted_input_versions[next_element_after_match]['point'] <= wanted_point_version):
-                next_element_after_match += 1
-        else:
-            # if key is x.y then all point versions of x.y are matched
-            while next_element_after_match < len(sorted_input_versions) and sorted_input_versions[next_element_after_match]['minor'] == wanted_minor_version:
-                next_element_after_match += 1
-    else:
-        # if key is x then all versions x.y.z (for all values of y and z) are matched
-        while next_element_after_match < len(sorted_input_versions) and sorted_input_versions[next_element_after_match]['major'] == wanted_major_version:
-            next_element_after_match += 1
 
-    return sorted_input_versions[:next_element_after_match]
+def match_eq(version_keys, key_info):
+    '''Execute the 'eq' matching logic against version_keys, the sorted packed version keys, and return the (lower,
+       upper) index bounds of the matching versions.  key_info is a tuple as returned by parse_match_key(); its
+       decorator is not considered here.'''
+    (lower_key, upper_key) = match_key_bounds(key_info)
+
+    return (bisect_left(version_keys, lower_key), bisect_left(version_keys, upper_key))
+
+
+def match_gte(version_keys, key_info):
+    '''Execute 'gte' matching logic against version_keys, the sorted packed version keys, and return the (lower,
+       upper) index bounds of the matching versions.  key_info is a tuple as returned by parse_match_key().'''
+    (lower_key, upper_key) = match_key_bounds(key_info)
+
+    return (bisect_left(version_keys, lower_key), len(version_keys))
+
+
+def match_lte(version_keys, key_info):
+    '''Execute 'lte' matching logic against version_keys, the sorted packed version keys, and return the (lower,
+       upper) index bounds of the matching versions.  key_info is a tuple as returned by parse_match_key().  If the key
+       is x or x.y, every version x.* or x.y.* is matched.'''
+    (lower_key, upper_key) = match_key_bounds(key_info)
+
+    return (0, bisect_left(version_keys, upper_key))
+
+
+# For each criteria, whether it takes a match key and the function that applies it
+criteria_matchers = {
+    "latest": (False, match_latest),
+    "gte": (True, match_gte),
+    "lte": (True, match_lte),
+    "eq": (True, match_eq),
+}
 
 
 class FilterModule(object):
     '''Base Filter definition, required by Ansible importer.'''
+    # Built once rather than on every call to filters()
+    _filters = {
+        'github_release_version': github_release_version,
+    }
+
     def filters(self):
         '''Standard function that Ansible uses in order to find filter hook.'''
-        return {
-            'github_release_version': github_release_version,
-        }
-
-
-class TestModule(unittest.TestCase):
-    '''unittest implementation for this filter.'''
-    data_set_01 = [
-        "v0.1.0",
-        "Helm v0.1.1",
-        "v2.0.0",
-        "v3.0.0-alpha",
-        "v0.0.0",
-        "Foo Boo v1.0.0",
-        "v1.0.0-alpha",
-        "v1.1.2",
-        "v1.1.21",
-        "1.1.3",
-        "v0.1.2",
-        "v1.1.18-beta",
-        "v1.1.20",
-    ]
-
-    def test_latest(self):
-        '''unittest for 'latest' operator.'''
-        self.assertEqual(github_release_version(TestModule.data_set_01, "latest", normalize=False), ["v2.0.0"], "Latest version is v2.0.0")
-
-    def test_eq(self):
-        '''unittest for 'eq' operator.'''
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1", normalize=False),
-                ["Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21"],
-                "'eq' major version '1' returns all versions starting with 'v1.' without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1"),
-                ["1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21"],
-                "'eq' major version '1' returns all versions starting with 'v1.'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.1", normalize=False),
-                ["v1.1.2", "1.1.3", "v1.1.20", "v1.1.21"],
-                "'eq' major.minor version '1.1' returns all versions starting with 'v1.1 without normalization'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.1"),
-                ["1.1.2", "1.1.3", "1.1.20", "1.1.21"],
-                "'eq' major.minor version '1.1' returns all versions starting with 'v1.1'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.1.20", normalize=False),
-                ["v1.1.20"],
-                "'eq' version '1.1.20' returns all versions starting with 'v1.1.20 without normalization'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.1.20"),
-                ["1.1.20"],
-                "'eq' version '1.1.20' returns all versions starting with 'v1.1.20'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "4", normalize=False),
-                [],
-                "'eq' major version '4' returns empty list without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "4"),
-                [],
-                "'eq' major version '4' returns empty list")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.2", normalize=False),
-                [],
-                "'eq' major.minor version '1.2' returns empty list without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.2"),
-                [],
-                "'eq' major.minor version '1.2' returns empty list")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.1.15", normalize=False),
-                [],
-                "'eq' version '1.1.15' returns an empty list without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "eq", "1.1.15"),
-                [],
-                "'eq' version '1.1.15' returns an empty list")
-
-        self.assertEqual(github_release_version([], "eq", "1.1.0"), [], "'eq' version 1.1.0 on empty input list returns an empty list")
-
-    def test_lte(self):
-        '''unittest for 'lte' operator.'''
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "1", normalize=False),
-                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21"],
-                "'lte' major version '1' returns all versions starting with 'v0.' or 'v1.' without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "1"),
-                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21"],
-                "'lte' major version '1' returns all versions starting with 'v0.' or 'v1.'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "1.0", normalize=False),
-                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0"],
-                "'lte' major.minor version '1.0' returns all versions starting with 'v0.' or 'v1.0' without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "1.0"),
-                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0"],
-                "'lte' major.minor version '1.0' returns all versions starting with 'v0.' or 'v1.0'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "1.1.4", normalize=False),
-                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0", "v1.1.2", "1.1.3"],
-                "'lte' version '1.1.4' returns all versions starting with 'v0.', 'v1.0.' or 'v1.1' where point <= 4 without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "1.1.4"),
-                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0", "1.1.2", "1.1.3"],
-                "'lte' version '1.1.4' returns all versions starting with 'v0.', 'v1.0.' or 'v1.1' where point <= 4")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "10.0.0", normalize=False),
-                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21", "v2.0.0"],
-                "'lte' version '10.0.0' returns all versions without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "10.0.0"),
-                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21", "2.0.0"],
-                "'lte' version '10.0.0' returns all versions")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "0.0.0", normalize=False),
-                ["v0.0.0"],
-                "'lte' version '0.0.0' returns only v0.0.0 without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "lte", "0.0.0"),
-                ["0.0.0"],
-                "'lte' version '0.0.0' returns only v0.0.0")
-
-        self.assertEqual(github_release_version([], "lte", "1.1.1"), [], "'lte' version 1.1.1 on empty input list returns an empty list")
-
-    def test_gte(self):
-        '''unittest for 'gte' operator.'''
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1", normalize=False),
-                ["Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21", "v2.0.0"],
-                "'gte' major version '1' returns all versions except those starting with v0. without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1"),
-                ["1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21", "2.0.0"],
-                "'gte' major version '1' returns all versions except those starting with v0.")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1.1", normalize=False),
-                ["v1.1.2", "1.1.3", "v1.1.20", "v1.1.21", "v2.0.0"],
-                "'gte' major version '1' returns all versions except those starting with v0. or v1.0. without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1.1"),
-                ["1.1.2", "1.1.3", "1.1.20", "1.1.21", "2.0.0"],
-                "'gte' major version '1' returns all versions except those starting with v0. or v1.0.")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1.1.4", normalize=False),
-                ["v1.1.20", "v1.1.21", "v2.0.0"],
-                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0' without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1.1.4"),
-                ["1.1.20", "1.1.21", "2.0.0"],
-                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1.1.20", normalize=False),
-                ["v1.1.20", "v1.1.21", "v2.0.0"],
-                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0' without normalization")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "1.1.20"),
-                ["1.1.20", "1.1.21", "2.0.0"],
-                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0'")
-
-        self.assertEqual(
-                github_release_version(TestModule.data_set_01, "gte", "3", normalize=False),
-                [],
-                "'gte' version '3' returns an empty list without normalization")
-
-        self.assertEqual(github_release_version([], "gte", "1.1.1"), [], "'gte' version 1.1.1 on empty input list returns an empty list")
-
-
-if __name__ == '__main__':
-    unittest.main()
+        return self._filters
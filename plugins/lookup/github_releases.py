@@ -1,9 +1,9 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import json
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleError, AnsibleParserError
 from ansible.plugins.lookup import LookupBase
@@ -23,6 +23,8 @@ DOCUMENTATION = r"""
       required: True
   notes:
     - does not currently support tokens, so can only read from public repositories
+    - every release is retrieved, 100 per request, so a repository with a long release history takes several API requests
+      per lookup; unauthenticated requests are limited by github to 60 per hour
 """
 
 RETURN = """
@@ -35,40 +37,70 @@ RETURN = """
 
 display = Display()
 
+owner_repo_matcher = re.compile(r'([^/]+)/([^/]+)')
+
+
+def fetch_releases(session, owner, repository):
+    '''Retrieve every release for the github repository owner/repository using the requests session 'session' and
+       return them as a list of the JSON elements decoded from each page of the response.  The API returns 30 releases per page by default, so ask for
+       its maximum of 100 and follow the 'next' link until there are no more pages.'''
+    api_url = f"https://api.github.com/repos/{owner}/{repository}/releases?per_page=100"
+
+    releases = []
+    while api_url is not None:
+        response = session.get(api_url, allow_redirects=True, timeout=30)
+
+        if response.status_code == 404:
+            raise AnsibleError(f"no such repository at github.com for {owner}/{repository}")
+
+        if response.status_code != 200:
+            raise AnsibleError(f"received response code {response.status_code} from GET request for {api_url}")
+
+        page = response.json()
+
+        if not isinstance(page, list):
+            raise AnsibleError(f"expected JSON element type list in response body, got ({type(page)})")
+
+        releases.extend(page)
+        api_url = response.links.get('next', {}).get('url')
+
+    return releases
+
 
 class LookupModule(LookupBase):
     @staticmethod
     def perform_lookup(terms):
         '''Iterate through 'terms', which should be a list of strings of the format OWNER/REPO.  For each, retreive the set of releases.
            In practice, this will have a satisfying result only if 'terms' has a single member.'''
-        ret = []
+        repositories = []
         for term in terms:
             display.vvv(f"github_releases term: {term}")
 
-            print(term)
-
-            term_split_match = re.fullmatch(r'([^/]+)/([^/]+)', term)
+            term_split_match = owner_repo_matcher.fullmatch(term)
 
             if term_split_match is None:
                 raise AnsibleParserError("github_release requires OWNER/REPO")
 
-            (owner, repository) = term_split_match.group(1, 2)
+            repositories.append(term_split_match.group(1, 2))
 
-            api_url = f"https://api.github.com/repos/{owner}/{repository}/releases"
+        if len(repositories) == 0:
+            return []
 
-            response = requests.get(api_url, allow_redirects=True, timeout=30)
+        # One session per lookup lets the pages and repositories fetched here reuse kept-alive connections.  It is not
+        # kept at module level because ansible runs each task in a forked worker, which would inherit the controller's
+        # open connections and discard the session's pool when it exits anyway.
+        with requests.Session() as session:
+            session.headers.update({'Accept': 'application/vnd.github+json', 'User-Agent': 'ansible-github-releases'})
 
-            if response.status_code == 404:
-                raise AnsibleError(f"no such repository at github.com for {owner}/{repository}")
-
-            if response.status_code != 200:
-                raise AnsibleError(f"received response code {response.status_code} from GET request for {api_url}")
-
-            releases = json.loads(response.content)
-
-            if not isinstance(releases, list):
-                raise AnsibleError(f"expected JSON element type list in response body, got ({type(releases)})")
+            # Each request spends nearly all of its time waiting on the network, so fetch the repositories
+            # concurrently.  map() yields in order and re-raises the first failure, just as fetching them one after
+            # another would.
+            with ThreadPoolExecutor(max_workers=min(8, len(repositories))) as executor:
+                releases_per_repository = list(
+                    executor.map(lambda repository: fetch_releases(session, *repository), repositories))
 
+        ret = []
+        for releases in releases_per_repository:
             for release in releases:
                 if not isinstance(release, dict):
                     raise AnsibleError(f"expected JSON element type dict in response body, got ({type(release)})")
@@ -0,0 +1,259 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.blorticus.tools.plugins.filter.github_release_version import github_release_version, parse_version_name
+
+
+class TestGithubReleaseVersion(unittest.TestCase):
+    '''unittest implementation for the github_release_version filter.'''
+    data_set_01 = [
+        "v0.1.0",
+        "Helm v0.1.1",
+        "v2.0.0",
+        "v3.0.0-alpha",
+        "v0.0.0",
+        "Foo Boo v1.0.0",
+        "v1.0.0-alpha",
+        "v1.1.2",
+        "v1.1.21",
+        "1.1.3",
+        "v0.1.2",
+        "v1.1.18-beta",
+        "v1.1.20",
+    ]
+
+    def test_parse_version_name(self):
+        '''unittest for splitting a single version name.'''
+        self.assertEqual(parse_version_name("v1.2.3"), ("1.2.3", 1, 2, 3, ""), "leading 'v' is stripped")
+        self.assertEqual(parse_version_name("1.2.3-rc-1"), ("1.2.3-rc-1", 1, 2, 3, "rc-1"), "decorator is everything after the first dash")
+        self.assertEqual(parse_version_name("Helm v0.1.1"), ("0.1.1", 0, 1, 1, ""), "release title before version is ignored")
+        self.assertEqual(parse_version_name("v1.2.3.4"), ("2.3.4", 2, 3, 4, ""), "four part version matches the trailing three parts")
+
+        with self.assertRaises(AnsibleFilterError):
+            parse_version_name("v1.2")
+
+    def test_large_version_numbers(self):
+        '''unittest for version numbers that do not fit in a small integer.'''
+        self.assertEqual(
+                github_release_version(["v1.0.20230501", "v1.0.9", "v1.1.0"], "lte", "1.0.99999999999999999999999"),
+                ["1.0.9", "1.0.20230501"],
+                "date based point versions sort numerically and an oversized key part matches every point version")
+
+        with self.assertRaises(AnsibleFilterError):
+            github_release_version(["v1.0.99999999999999999999999"], "latest")
+
+    def test_latest(self):
+        '''unittest for 'latest' operator.'''
+        self.assertEqual(github_release_version(TestGithubReleaseVersion.data_set_01, "latest", normalize=False), ["v2.0.0"], "Latest version is v2.0.0")
+        self.assertEqual(
+                github_release_version(["v1.0.0-alpha", "v1.0.0-beta"], "latest"),
+                [],
+                "'latest' returns an empty list when every version is decorated and decorated versions are excluded")
+
+    def test_eq(self):
+        '''unittest for 'eq' operator.'''
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1", normalize=False),
+                ["Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21"],
+                "'eq' major version '1' returns all versions starting with 'v1.' without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1"),
+                ["1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21"],
+                "'eq' major version '1' returns all versions starting with 'v1.'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.1", normalize=False),
+                ["v1.1.2", "1.1.3", "v1.1.20", "v1.1.21"],
+                "'eq' major.minor version '1.1' returns all versions starting with 'v1.1 without normalization'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.1"),
+                ["1.1.2", "1.1.3", "1.1.20", "1.1.21"],
+                "'eq' major.minor version '1.1' returns all versions starting with 'v1.1'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.1.20", normalize=False),
+                ["v1.1.20"],
+                "'eq' version '1.1.20' returns all versions starting with 'v1.1.20 without normalization'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.1.20"),
+                ["1.1.20"],
+                "'eq' version '1.1.20' returns all versions starting with 'v1.1.20'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "4", normalize=False),
+                [],
+                "'eq' major version '4' returns empty list without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "4"),
+                [],
+                "'eq' major version '4' returns empty list")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.2", normalize=False),
+                [],
+                "'eq' major.minor version '1.2' returns empty list without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.2"),
+                [],
+                "'eq' major.minor version '1.2' returns empty list")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.1.15", normalize=False),
+                [],
+                "'eq' version '1.1.15' returns an empty list without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.1.15"),
+                [],
+                "'eq' version '1.1.15' returns an empty list")
+
+        self.assertEqual(github_release_version([], "eq", "1.1.0"), [], "'eq' version 1.1.0 on empty input list returns an empty list")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.0.0-alpha", include_decorated_versions=True, normalize=False),
+                ["v1.0.0-alpha"],
+                "'eq' decorated version '1.0.0-alpha' returns only the version with that decorator without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "eq", "1.0.0-alpha"),
+                [],
+                "'eq' decorated version '1.0.0-alpha' returns an empty list when decorated versions are excluded")
+
+    def test_lte(self):
+        '''unittest for 'lte' operator.'''
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "1", normalize=False),
+                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21"],
+                "'lte' major version '1' returns all versions starting with 'v0.' or 'v1.' without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "1"),
+                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21"],
+                "'lte' major version '1' returns all versions starting with 'v0.' or 'v1.'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "1.0", normalize=False),
+                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0"],
+                "'lte' major.minor version '1.0' returns all versions starting with 'v0.' or 'v1.0' without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "1.0"),
+                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0"],
+                "'lte' major.minor version '1.0' returns all versions starting with 'v0.' or 'v1.0'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "1.1.4", normalize=False),
+                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0", "v1.1.2", "1.1.3"],
+                "'lte' version '1.1.4' returns all versions starting with 'v0.', 'v1.0.' or 'v1.1' where point <= 4 without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "1.1.4"),
+                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0", "1.1.2", "1.1.3"],
+                "'lte' version '1.1.4' returns all versions starting with 'v0.', 'v1.0.' or 'v1.1' where point <= 4")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "10.0.0", normalize=False),
+                ["v0.0.0", "v0.1.0", "Helm v0.1.1", "v0.1.2", "Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21", "v2.0.0"],
+                "'lte' version '10.0.0' returns all versions without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "10.0.0"),
+                ["0.0.0", "0.1.0", "0.1.1", "0.1.2", "1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21", "2.0.0"],
+                "'lte' version '10.0.0' returns all versions")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "0.0.0", normalize=False),
+                ["v0.0.0"],
+                "'lte' version '0.0.0' returns only v0.0.0 without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "lte", "0.0.0"),
+                ["0.0.0"],
+                "'lte' version '0.0.0' returns only v0.0.0")
+
+        self.assertEqual(github_release_version([], "lte", "1.1.1"), [], "'lte' version 1.1.1 on empty input list returns an empty list")
+
+        self.assertEqual(
+                github_release_version(["v1.0.0", "v2.0.0"], "lte", "1.0"),
+                ["1.0.0"],
+                "'lte' major.minor version '1.0' does not match a later major version with the same minor")
+
+    def test_gte(self):
+        '''unittest for 'gte' operator.'''
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1", normalize=False),
+                ["Foo Boo v1.0.0", "v1.1.2", "1.1.3", "v1.1.20", "v1.1.21", "v2.0.0"],
+                "'gte' major version '1' returns all versions except those starting with v0. without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1"),
+                ["1.0.0", "1.1.2", "1.1.3", "1.1.20", "1.1.21", "2.0.0"],
+                "'gte' major version '1' returns all versions except those starting with v0.")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1.1", normalize=False),
+                ["v1.1.2", "1.1.3", "v1.1.20", "v1.1.21", "v2.0.0"],
+                "'gte' major version '1' returns all versions except those starting with v0. or v1.0. without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1.1"),
+                ["1.1.2", "1.1.3", "1.1.20", "1.1.21", "2.0.0"],
+                "'gte' major version '1' returns all versions except those starting with v0. or v1.0.")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1.1.4", normalize=False),
+                ["v1.1.20", "v1.1.21", "v2.0.0"],
+                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0' without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1.1.4"),
+                ["1.1.20", "1.1.21", "2.0.0"],
+                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1.1.20", normalize=False),
+                ["v1.1.20", "v1.1.21", "v2.0.0"],
+                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0' without normalization")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1.1.20"),
+                ["1.1.20", "1.1.21", "2.0.0"],
+                "'gte' version '1.1.4' returns all versions starting with 'v1.1.x' where x >= 4 and 'v2.0.0'")
+
+        self.assertEqual(
+                github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "3", normalize=False),
+                [],
+                "'gte' version '3' returns an empty list without normalization")
+
+        self.assertEqual(github_release_version([], "gte", "1.1.1"), [], "'gte' version 1.1.1 on empty input list returns an empty list")
+
+        with self.assertRaises(AnsibleFilterError):
+            github_release_version(TestGithubReleaseVersion.data_set_01, "gte", "1.1.18-beta")
+
+    def test_full_labels_come_from_input(self):
+        class MarkedText(str):
+            pass
+
+        plain_input = ["v1.0.0", "v1.1.0"]
+        marked_input = [MarkedText("v1.0.0"), MarkedText("v1.1.0")]
+
+        github_release_version(plain_input, "latest", normalize=False)
+
+        for criteria_args in (("latest",), ("gte", "1"), ("eq", "1.0.0")):
+            result = github_release_version(marked_input, *criteria_args, normalize=False)
+            self.assertTrue(
+                    all(any(label is version for version in marked_input) for label in result),
+                    f"'{criteria_args[0]}' without normalization returns the input's own version objects after an equal input was filtered")
+
+
+if __name__ == '__main__':
+    unittest.main()
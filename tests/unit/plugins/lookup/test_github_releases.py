@@ -0,0 +1,125 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+import unittest
+from unittest import mock
+
+from ansible.errors import AnsibleError, AnsibleParserError
+
+from ansible_collections.blorticus.tools.plugins.lookup import github_releases
+from ansible_collections.blorticus.tools.plugins.lookup.github_releases import LookupModule
+
+
+class FakeResponse:
+    '''A stand-in for requests.Response carrying a status code, a decoded JSON body and the parsed Link header.'''
+    def __init__(self, body, status_code=200, next_url=None):
+        self.status_code = status_code
+        self.body = body
+        self.links = {} if next_url is None else {'next': {'url': next_url}}
+
+    def json(self):
+        return self.body
+
+
+class TestGithubReleases(unittest.TestCase):
+    '''unittest implementation for the github_releases lookup.'''
+    def perform_lookup_with_responses(self, terms, responses):
+        '''Run perform_lookup() for 'terms' with each GET answered by responses[url].  Return the lookup result and the
+           URLs that were requested.'''
+        requested_urls = []
+
+        def get(url, **kwargs):
+            requested_urls.append(url)
+            return responses[url]
+
+        with mock.patch.object(github_releases.requests, 'Session') as session_class:
+            session = session_class.return_value.__enter__.return_value
+            session.headers = {}
+            session.get.side_effect = get
+            return (LookupModule.perform_lookup(terms), requested_urls)
+
+    def test_pagination(self):
+        '''unittest for following the 'next' link across pages of releases.'''
+        first_page_url = "https://api.github.com/repos/owner/repo/releases?per_page=100"
+        second_page_url = "https://api.github.com/repositories/1/releases?per_page=100&page=2"
+        third_page_url = "https://api.github.com/repositories/1/releases?per_page=100&page=3"
+
+        (result, requested_urls) = self.perform_lookup_with_responses(["owner/repo"], {
+            first_page_url: FakeResponse([{"name": "v3.0.0"}, {"name": "v2.1.0"}], next_url=second_page_url),
+            second_page_url: FakeResponse([{"name": "v2.0.0"}], next_url=third_page_url),
+            third_page_url: FakeResponse([{"name": "v1.0.0"}]),
+        })
+
+        self.assertEqual(result, ["v3.0.0", "v2.1.0", "v2.0.0", "v1.0.0"], "releases from every page are returned in page order")
+        self.assertEqual(requested_urls, [first_page_url, second_page_url, third_page_url], "each page is requested once, stopping at the last")
+
+        (result, requested_urls) = self.perform_lookup_with_responses(["owner/repo"], {first_page_url: FakeResponse([])})
+        self.assertEqual(result, [], "a repository with no releases returns an empty list")
+        self.assertEqual(requested_urls, [first_page_url], "a single page without a 'next' link is the only request")
+
+    def test_error_status_on_later_page(self):
+        '''unittest for error responses to a page after the first.'''
+        first_page_url = "https://api.github.com/repos/owner/repo/releases?per_page=100"
+        second_page_url = "https://api.github.com/repositories/1/releases?per_page=100&page=2"
+
+        for (status_code, message) in ((404, "no such repository at github.com for owner/repo"), (500, "received response code 500")):
+            with self.assertRaisesRegex(AnsibleError, message):
+                self.perform_lookup_with_responses(["owner/repo"], {
+                    first_page_url: FakeResponse([{"name": "v2.0.0"}], next_url=second_page_url),
+                    second_page_url: FakeResponse({"message": "error"}, status_code=status_code),
+                })
+
+        with self.assertRaisesRegex(AnsibleError, "expected JSON element type list"):
+            self.perform_lookup_with_responses(["owner/repo"], {
+                first_page_url: FakeResponse([{"name": "v2.0.0"}], next_url=second_page_url),
+                second_page_url: FakeResponse({"message": "error"}),
+            })
+
+        with self.assertRaisesRegex(AnsibleError, "expected JSON element type dict"):
+            self.perform_lookup_with_responses(["owner/repo"], {
+                first_page_url: FakeResponse([{"name": "v2.0.0"}], next_url=second_page_url),
+                second_page_url: FakeResponse(["v1.0.0"]),
+            })
+
+    def test_term_order(self):
+        '''unittest for keeping the order of terms when their releases are fetched concurrently.'''
+        terms = [f"owner/repo{n}" for n in range(10)]
+
+        class SlowFirstResponse(FakeResponse):
+            def json(self):
+                time.sleep(0.2)
+                return self.body
+
+        responses = {f"https://api.github.com/repos/{term}/releases?per_page=100": FakeResponse([{"name": term}]) for term in terms}
+        responses[f"https://api.github.com/repos/{terms[0]}/releases?per_page=100"] = SlowFirstResponse([{"name": terms[0]}])
+
+        (result, _) = self.perform_lookup_with_responses(terms, responses)
+        self.assertEqual(result, terms, "releases are returned in the order of the terms, even if an earlier term finishes last")
+
+        with self.assertRaisesRegex(AnsibleError, "no such repository at github.com for owner/repo3"):
+            responses["https://api.github.com/repos/owner/repo3/releases?per_page=100"] = FakeResponse({}, status_code=404)
+            self.perform_lookup_with_responses(terms, responses)
+
+    def test_invalid_term(self):
+        '''unittest for terms that are not OWNER/REPO.'''
+        for term in ("owner", "owner/repo/extra", "/repo"):
+            with self.assertRaises(AnsibleParserError, msg=f"term {term!r} is rejected"):
+                self.perform_lookup_with_responses([term], {})
+
+        self.assertEqual(self.perform_lookup_with_responses([], {}), ([], []), "no terms returns an empty list without any request")
+
+    def test_non_dict_releases(self):
+        '''unittest for release elements that are not JSON objects.'''
+        url = "https://api.github.com/repos/owner/repo/releases?per_page=100"
+
+        for bad_release in ("foo", ["x"], ["name"], 3):
+            with self.assertRaises(AnsibleError, msg=f"release element {bad_release!r} raises an AnsibleError"):
+                self.perform_lookup_with_responses(["owner/repo"], {url: FakeResponse([{"name": "v1"}, bad_release])})
+
+        (result, _) = self.perform_lookup_with_responses(["owner/repo"], {url: FakeResponse([{"name": "v1"}, {"id": 2}])})
+        self.assertEqual(result, ["v1"], "releases without a name are skipped")
+
+
+if __name__ == '__main__':
+    unittest.main()